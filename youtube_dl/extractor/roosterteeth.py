@@ -51,6 +51,7 @@ class RoosterTeethIE(InfoExtractor):
         'only_matching': True,
     }]
     _EPISODE_BASE_URL = 'https://svod-be.roosterteeth.com/api/v1/episodes/'
+    _THUMBNAIL_SIZES = ('thumb', 'small', 'medium', 'large')
 
     def _login(self):
         username, password = self._get_login_info()
@@ -109,15 +110,16 @@ class RoosterTeethIE(InfoExtractor):
 
         thumbnails = []
         for image in episode.get('included', {}).get('images', []):
-            if image.get('type') == 'episode_image':
-                img_attributes = image.get('attributes') or {}
-                for k in ('thumb', 'small', 'medium', 'large'):
-                    img_url = img_attributes.get(k)
-                    if img_url:
-                        thumbnails.append({
-                            'id': k,
-                            'url': img_url,
-                        })
+            if image.get('type') != 'episode_image':
+                continue
+            img_attributes = image.get('attributes') or {}
+            for k in self._THUMBNAIL_SIZES:
+                img_url = img_attributes.get(k)
+                if img_url:
+                    thumbnails.append({
+                        'id': k,
+                        'url': img_url,
+                    })
 
         return {
             'id': video_id,